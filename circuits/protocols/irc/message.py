@@ -22,7 +22,7 @@ class Message(object):
         self._check_args()
 
     def _check_args(self):
-        if any(type(arg)(' ') in arg in arg for arg in self.args[:-1] if isinstance(arg, string_types)):
+        if any(type(arg)(' ') in arg for arg in self.args[:-1] if isinstance(arg, string_types)):
             raise Error("Space can only appear in the very last arg")
         if any(type(arg)('\n') in arg for arg in self.args if isinstance(arg, string_types)):
             raise Error("No newline allowed")
@@ -40,24 +40,18 @@ class Message(object):
         return self.__unicode__() if PY3 else self.__bytes__()
 
     def __bytes__(self):
-        return text_type(self).encode(self.encoding)
+        return self.__unicode__().encode(self.encoding)
 
     def __unicode__(self):
         self._check_args()
         args = self.args[:]
 
         if args and u(" ") in args[-1] and not args[-1].startswith(u(":")):
-            args[-1] = u(":{0:s}").format(args[-1])
-
-        return u("{prefix:s}{command:s} {args:s}\r\n").format(
-            prefix=(
-                u(":{0:s} ").format(self.prefix)
-                if self.prefix is not None
-                else u("")
-            ),
-            command=text_type(self.command),
-            args=u(" ").join(args)
-        )
+            args[-1] = u(":") + args[-1]
+
+        prefix = u(":") + self.prefix + u(" ") if self.prefix is not None else u("")
+
+        return prefix + text_type(self.command) + u(" ") + u(" ").join(args) + u("\r\n")
 
     def __repr__(self):
         return repr(text_type(self)[:-2])
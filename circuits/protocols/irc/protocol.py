@@ -1,7 +1,7 @@
 """Internet Relay Chat Protocol"""
 
 
-from re import compile as compile_regex
+from string import digits
 
 from circuits import Component
 from circuits.net.events import write
@@ -11,8 +11,6 @@ from .commands import PONG
 from .events import response
 from .utils import parsemsg
 
-NUMERIC = compile_regex("[0-9]+")
-
 
 class IRC(Component):
 
@@ -50,9 +48,15 @@ class IRC(Component):
 
         prefix, command, args = parsemsg(line, encoding=self.encoding)
 
+        if not command:
+            # Empty or whitespace-only line
+            return
+
         command = command.lower()
 
-        if NUMERIC.match(command):
+        # ASCII digits only: str.isdigit() also accepts e.g. superscripts,
+        # which int() rejects
+        if command and not command.strip(digits):
             args.insert(0, int(command))
             command = "numeric"
 
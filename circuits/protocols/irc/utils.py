@@ -3,9 +3,8 @@
 
 from re import compile as compile_regex
 
-from circuits.six import u
+from circuits.six import PY3, u
 
-PREFIX = compile_regex("([^!].*)!(.*)@(.*)")
 COLOR_CODE = compile_regex(r'(?:(\d\d?)(?:(,)(\d\d?))?)?')
 COLOR = compile_regex(r"\x03(?:(\d\d?)(?:,(\d\d?))?)?")
 
@@ -27,9 +26,8 @@ def strip(s, color=False):
     :returns str: returns processes string
     """
 
-    if len(s) > 0:
-        if s[0] == u(":"):
-            s = s[1:]
+    if s.startswith(u(":")):
+        s = s[1:]
     if color:
         s = s.replace(u("\x01"), u(""))
         s = s.replace(u("\x02"), u(""))  # bold
@@ -38,8 +36,7 @@ def strip(s, color=False):
         s = s.replace(u("\x1e"), u(""))  # strikethrough
         s = s.replace(u("\x11"), u(""))  # monospace
         s = s.replace(u("\x16"), u(""))  # reverse color
-        s = COLOR.sub(u(""), s)  # color codes
-        s = s.replace(u("\x03"), u(""))  # color
+        s = COLOR.sub(u(""), s)  # color codes (also removes bare \x03)
         s = s.replace(u("\x0f"), u(""))  # reset
     return s
 
@@ -65,10 +62,12 @@ def parseprefix(prefix):
     :returns tuple: tuple of strings in the form of (nick, user, host)
     """
 
-    m = PREFIX.match(prefix)
+    # Same result as matching ([^!].*)!(.*)@(.*) without using a regex
+    at = prefix.rfind(u("@"))
+    bang = prefix.rfind(u("!"), 1, at) if at > 1 else -1
 
-    if m is not None:
-        return m.groups()
+    if bang != -1 and prefix[0] != u("!"):
+        return prefix[:bang], prefix[bang + 1:at], prefix[at + 1:]
     else:
         return prefix or None, None, None
 
@@ -85,25 +84,25 @@ def parsemsg(s, encoding="utf-8"):
     s = s.decode(encoding, 'replace')
 
     prefix = u("")
-    trailing = []
 
     if s and s[0] == u(":"):
-        prefix, s = s[1:].split(u(" "), 1)
+        prefix, _, s = s[1:].partition(u(" "))
 
     prefix = parseprefix(prefix)
 
-    if s.find(u(" :")) != -1:
-        s, trailing = s.split(u(" :"), 1)
-        args = s.split()
-        args.append(trailing)
+    i = s.find(u(" :"))
+    if i != -1:
+        args = s[:i].split()
+        args.append(s[i + 2:])
     else:
         args = s.split()
 
-    args = iter(args)
-    command = next(args, None)
-    command = command and str(command)
+    command = args.pop(0) if args else None
+    if command is not None and not PY3:
+        # Event names must be native strings
+        command = command.encode("ascii", "replace")
 
-    return prefix, command, list(args)
+    return prefix, command, args
 
 
 def irc_color_to_ansi(data, reset=True):
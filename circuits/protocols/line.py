@@ -4,12 +4,7 @@ This module implements the basic Line protocol.
 
 This module can be used in both server and client implementations.
 """
-import re
-
 from circuits.core import BaseComponent, Event, handler
-from circuits.six import b
-
-LINESEP = re.compile(b("\r?\n"))
 
 
 def splitLines(s, buffer):
@@ -21,8 +16,8 @@ def splitLines(s, buffer):
     buffer for further processing.
     """
 
-    lines = LINESEP.split(buffer + s)
-    return lines[:-1], lines[-1]
+    lines = (buffer + s).split(b"\n")
+    return [x[:-1] if x.endswith(b"\r") else x for x in lines[:-1]], lines[-1]
 
 
 class line(Event):
@@ -95,14 +90,18 @@ class Line(BaseComponent):
 
     @handler("read")
     def _on_read(self, *args):
+        fire = self.fire
+
         if len(args) == 1:
             # Client read
             data, = args
             lines, self.buffer = self.splitter(data, self.buffer)
-            [self.fire(line(x)) for x in lines]
+            for x in lines:
+                fire(line(x))
         else:
             # Server read
             sock, data = args
             lines, buffer = self.splitter(data, self.getBuffer(sock))
             self.updateBuffer(sock, buffer)
-            [self.fire(line(sock, x)) for x in lines]
+            for x in lines:
+                fire(line(sock, x))
@@ -1,5 +1,6 @@
 """Workers Tests"""
 
+from itertools import repeat
 from os import getpid
 
 import pytest
@@ -24,12 +25,7 @@ def err():
 
 
 def foo():
-    x = 0
-    i = 0
-    while i < 1000000:
-        x += 1
-        i += 1
-    return x
+    return sum(repeat(1, 1000000))
 
 
 def pid():
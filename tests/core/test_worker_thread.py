@@ -1,6 +1,8 @@
 """Workers Tests"""
 
 
+from itertools import repeat
+
 import pytest
 
 from circuits import Worker, task
@@ -23,12 +25,7 @@ def worker(request, manager, watcher):
 
 
 def f():
-    x = 0
-    i = 0
-    while i < 1000000:
-        x += 1
-        i += 1
-    return x
+    return sum(repeat(1, 1000000))
 
 
 def add(a, b):
@@ -55,6 +55,10 @@ def test_strip():
     s = strip(s, color=True)
     assert s == "test"
 
+    s = ":\x0304,01red\x03 \x03plain\x0f"
+    s = strip(s, color=True)
+    assert s == "red plain"
+
 
 def test_joinprefix():
     nick, ident, host = "test", "foo", "localhost"
@@ -69,6 +73,17 @@ def test_parsemsg():
     assert command == "NICK"
     assert args == [u("foobar")]
 
+    s = b(":foo!bar@localhost PRIVMSG #test :Hello :World")
+    source, command, args = parsemsg(s)
+    assert command == "PRIVMSG"
+    assert args == [u("#test"), u("Hello :World")]
+
+    s = b(":localhost")
+    source, command, args = parsemsg(s)
+    assert source == (u("localhost"), None, None)
+    assert command is None
+    assert args == []
+
     s = b("")
     source, command, args = parsemsg(s)
     assert source == (None, None, None)
@@ -83,6 +98,12 @@ def test_parseprefix():
     assert ident == "foo"
     assert host == "localhost"
 
+    s = "test!foo@bar!baz"
+    nick, ident, host = parseprefix(s)
+    assert nick == "test"
+    assert ident == "foo"
+    assert host == "bar!baz"
+
     s = "test"
     nick, ident, host = parseprefix(s)
     assert nick == "test"
@@ -133,6 +154,13 @@ def test_commands(event, data):
             u("*** Looking up your hostname..."),
         )
     ),
+    (
+        b":localhost 001 test :Welcome to the Test IRC Network\r\n",
+        Event.create(
+            "numeric", (u("localhost"), None, None), 1, u("test"),
+            u("Welcome to the Test IRC Network"),
+        )
+    ),
 ])
 def test_responses(app, data, event):
     app.reset()
@@ -147,6 +175,36 @@ def test_responses(app, data, event):
     assert event.kwargs == e.kwargs
 
 
+def test_empty_lines(app):
+    app.reset()
+    app.fire(read(b"\r\n \r\n"))
+    while len(app):
+        app.flush()
+
+    assert "exception" not in [e.name for e in app.events]
+    assert "response" not in [e.name for e in app.events]
+
+
+def test_malformed_lines(app):
+    app.reset()
+    app.fire(read(b":localhost\r\n"))
+    while len(app):
+        app.flush()
+
+    assert "exception" not in [e.name for e in app.events]
+    assert "response" not in [e.name for e in app.events]
+
+
+def test_non_ascii_numeric(app):
+    app.reset()
+    app.fire(read(b":localhost \xc2\xb2 test\r\n"))
+    while len(app):
+        app.flush()
+
+    assert "exception" not in [e.name for e in app.events]
+    assert "numeric" not in [e.name for e in app.events]
+
+
 @pytest.mark.parametrize('inp,out', [
     ('hi \x02bold\x02 \x1ditalic\x1d \x1funderline\x1f \x1estrikethrough\x1e', 'hi \x02bold\x02 \x1b[03mitalic\x1b[23m \x1b[04munderline\x1b[24m \x1b[09mstrikethrough\x1b[29m'),
     ('\x0300white\x03 \x0301black\x03 \x0302blue\x03 \x0303green\x03 \x0304red\x03 ', '\x1b[37mwhite\x1b[39;49m \x1b[30mblack\x1b[39;49m \x1b[34mblue\x1b[39;49m \x1b[32mgreen\x1b[39;49m \x1b[31mred\x1b[39;49m '),
@@ -1,4 +1,3 @@
-import itertools
 from email.generator import _make_boundary
 from mimetypes import guess_type
 
@@ -19,39 +18,36 @@ class MultiPartForm(dict):
         self.files.append((fieldname, filename, mimetype, body))
 
     def bytes(self):
+        part_boundary = ("--%s" % self.boundary).encode("ascii")
+
+        def encode(value):
+            return value if isinstance(value, bytes) else value.encode("ascii")
+
         parts = []
-        part_boundary = bytearray("--%s" % self.boundary, "ascii")
 
         # Add the form fields
-        parts.extend([
-            part_boundary,
-            bytearray(
-                "Content-Disposition: form-data; name=\"%s\"" % k,
-                "ascii"
-            ),
-            bytes(),
-            v if isinstance(v, bytes) else bytearray(v, "ascii")
-        ] for k, v in list(self.items()))
+        for k, v in list(self.items()):
+            parts.extend([
+                part_boundary,
+                ("Content-Disposition: form-data; name=\"%s\"" % k).encode("ascii"),
+                b"",
+                encode(v),
+            ])
 
         # Add the files to upload
-        parts.extend([
-            part_boundary,
-            bytearray(
-                "Content-Disposition: form-data; name=\"%s\"; filename=\"%s\"" % (
-                    fieldname, filename),
-                "ascii"
-            ),
-            bytearray("Content-Type: %s" % content_type, "ascii"),
-            bytearray(),
-            body if isinstance(body, bytes) else bytearray(body, "ascii"),
-        ] for fieldname, filename, content_type, body in self.files)
-
-        # Flatten the list and add closing boundary marker,
-        # then return CR+LF separated data
-        flattened = list(itertools.chain(*parts))
-        flattened.append(bytearray("--%s--" % self.boundary, "ascii"))
-        res = bytearray()
-        for item in flattened:
-            res += item
-            res += bytearray("\r\n", "ascii")
-        return res
+        for fieldname, filename, content_type, body in self.files:
+            parts.extend([
+                part_boundary,
+                (
+                    "Content-Disposition: form-data; name=\"%s\"; filename=\"%s\"" % (
+                        fieldname, filename)
+                ).encode("ascii"),
+                ("Content-Type: %s" % content_type).encode("ascii"),
+                b"",
+                encode(body),
+            ])
+
+        # Add closing boundary marker, then return CR+LF separated data
+        parts.append(("--%s--" % self.boundary).encode("ascii"))
+        parts.append(b"")
+        return b"\r\n".join(parts)